@@ -172,6 +172,7 @@ setup(
     extras_require={  # Optional
         'dev': ['check-manifest'],
         'test': ['coverage'],
+        'numba': ['numba'],
     },
 
     # If there are data files included in your packages that need to be
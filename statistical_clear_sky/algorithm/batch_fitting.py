@@ -0,0 +1,57 @@
+"""
+This module defines a helper to run "Statistical Clear Sky Fitting" on
+several independent data sets, e.g. the systems of a PV fleet, in parallel.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from statistical_clear_sky.algorithm.iterative_fitting import IterativeFitting
+
+def batch_fit(data_matrices, max_workers=None, fitting_kwargs=None,
+              execute_kwargs=None):
+    """
+    Fits each data matrix in its own worker process. The fits are
+    independent, so separate processes avoid the GIL and each one holds its
+    own solver environment (with MOSEK, one license token per process).
+
+    On platforms that start worker processes by spawning (macOS, Windows),
+    the calling script must invoke this under
+    ``if __name__ == '__main__':``, since each worker re-imports it.
+
+    Arguments
+    ---------
+    data_matrices : iterable of numpy arrays
+        Power signals matrices, one per system.
+
+    Keyword arguments
+    -----------------
+    max_workers : integer
+        Number of worker processes. Defaults to the number of processors.
+    fitting_kwargs : dictionary
+        Passed on to the IterativeFitting constructor, e.g. rank_k,
+        solver_type or reserve_test_data.
+    execute_kwargs : dictionary
+        Passed on to IterativeFitting.execute. Verbose output is off unless
+        requested, since output from the workers would be interleaved.
+
+    Returns
+    -------
+    list of IterativeFitting
+        Fitted instances, in the same order as data_matrices. The CVXPY
+        problems cannot be sent back from the workers, so left_problem and
+        right_problem of the returned instances are None.
+    """
+    if fitting_kwargs is None:
+        fitting_kwargs = {}
+    execute_kwargs = dict({'verbose': False}, **(execute_kwargs or {}))
+    fit = partial(_fit, fitting_kwargs=fitting_kwargs,
+                  execute_kwargs=execute_kwargs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fit, data_matrices))
+
+def _fit(data_matrix, fitting_kwargs, execute_kwargs):
+    iterative_fitting = IterativeFitting(data_matrix, **fitting_kwargs)
+    iterative_fitting.execute(**execute_kwargs)
+    # CVXPY problems hold solver objects that cannot be pickled:
+    iterative_fitting._l_problem = None
+    iterative_fitting._r_problem = None
+    return iterative_fitting
@@ -3,13 +3,15 @@ This module defines the class for Singular Value Decomposition related
  operations.
 """
 import numpy as np
+from scipy.sparse.linalg import svds
 
 class SingularValueDecomposition:
     """
     Class to perform various calculations based on Sigular Value Decomposition.
     """
 
-    def decompose(self, power_signals_d, rank_k=4):
+    def decompose(self, power_signals_d, rank_k=4,
+                  initial_left_singular_vectors_u=None):
         """
         Arguments
         ---------
@@ -21,10 +23,24 @@ class SingularValueDecomposition:
         -----------------
         rank_k : integer
             Rank of the resulting low rank matrices.
+            Only the leading rank_k singular triplets are computed and kept.
+        initial_left_singular_vectors_u : numpy array
+            Left singular vectors from a previous decomposition of similar
+            data (e.g. an overlapping window of the same system). If the
+            shape matches, they are used as the starting subspace of a few
+            block power iterations instead of computing the SVD from scratch.
         """
 
-        (left_singular_vectors_u, singular_values_sigma,
-         right_singular_vectors_v) = np.linalg.svd(power_signals_d)
+        if (initial_left_singular_vectors_u is not None and
+            initial_left_singular_vectors_u.shape ==
+                (power_signals_d.shape[0], rank_k)):
+            (left_singular_vectors_u, singular_values_sigma,
+             right_singular_vectors_v) = self._subspace_iteration(
+                power_signals_d, initial_left_singular_vectors_u)
+        else:
+            (left_singular_vectors_u, singular_values_sigma,
+             right_singular_vectors_v) = self._truncated_svd(power_signals_d,
+                                                             rank_k)
         left_singular_vectors_u, right_singular_vectors_v = \
             self._adjust_singular_vectors(left_singular_vectors_u,
                                            right_singular_vectors_v)
@@ -33,15 +49,70 @@ class SingularValueDecomposition:
         self._right_singular_vectors_v = right_singular_vectors_v
 
         self._matrix_l0 = self._left_singular_vectors_u[:, :rank_k]
-        self._matrix_r0 = np.diag(self._singular_values_sigma[:rank_k]).dot(
-            right_singular_vectors_v[:rank_k, :])
+        # Scales the rows of V rather than multiplying by diag(sigma):
+        self._matrix_r0 = (self._singular_values_sigma[:rank_k, np.newaxis]
+                           * right_singular_vectors_v[:rank_k, :])
+
+    def _truncated_svd(self, power_signals_d, rank_k):
+        """
+        Computes the leading rank_k singular triplets, in descending order
+        of singular value, without forming the full U and V matrices.
+        """
+        if rank_k < min(power_signals_d.shape) - 1:
+            # Fixed starting vector, so that results are reproducible:
+            initial_vector = np.ones(min(power_signals_d.shape))
+            (left_singular_vectors_u, singular_values_sigma,
+             right_singular_vectors_v) = svds(power_signals_d, k=rank_k,
+                                              v0=initial_vector)
+            # svds returns the singular values in ascending order.
+            order = np.argsort(singular_values_sigma)[::-1]
+            return (left_singular_vectors_u[:, order],
+                    singular_values_sigma[order],
+                    right_singular_vectors_v[order])
+        else:
+            (left_singular_vectors_u, singular_values_sigma,
+             right_singular_vectors_v) = np.linalg.svd(power_signals_d,
+                                                       full_matrices=False)
+            return (left_singular_vectors_u[:, :rank_k],
+                    singular_values_sigma[:rank_k],
+                    right_singular_vectors_v[:rank_k])
+
+    def _subspace_iteration(self, power_signals_d,
+                            initial_left_singular_vectors_u, iterations=2):
+        """
+        Refines a previous left singular subspace with block power
+        iterations, then extracts the singular triplets from the small
+        projected matrix (Rayleigh-Ritz).
+        """
+        basis_left, _ = np.linalg.qr(initial_left_singular_vectors_u)
+        for _ in range(iterations):
+            basis_right, _ = np.linalg.qr(power_signals_d.T.dot(basis_left))
+            basis_left, _ = np.linalg.qr(power_signals_d.dot(basis_right))
+        (small_left_singular_vectors_u, singular_values_sigma,
+         right_singular_vectors_v) = np.linalg.svd(
+            basis_left.T.dot(power_signals_d), full_matrices=False)
+        left_singular_vectors_u = basis_left.dot(small_left_singular_vectors_u)
+        return (left_singular_vectors_u, singular_values_sigma,
+                right_singular_vectors_v)
 
     def _adjust_singular_vectors(self, left_singular_vectors_u,
                                   right_singular_vectors_v):
-
-        if np.sum(left_singular_vectors_u[:, 0]) < 0:
-            left_singular_vectors_u[:, 0] *= -1
-            right_singular_vectors_v[0] *= -1
+        """
+        Fixes the sign of each singular pair, which is otherwise arbitrary
+        and differs between SVD routines: the first left singular vector
+        has a positive sum, the others have their largest-magnitude entry
+        positive.
+        """
+        for i in range(left_singular_vectors_u.shape[1]):
+            if i == 0:
+                is_flipped = np.sum(left_singular_vectors_u[:, 0]) < 0
+            else:
+                largest_entry = left_singular_vectors_u[
+                    np.argmax(np.abs(left_singular_vectors_u[:, i])), i]
+                is_flipped = largest_entry < 0
+            if is_flipped:
+                left_singular_vectors_u[:, i] *= -1
+                right_singular_vectors_v[i] *= -1
 
         return left_singular_vectors_u, right_singular_vectors_v
 
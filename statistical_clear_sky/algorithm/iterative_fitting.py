@@ -15,6 +15,8 @@ from statistical_clear_sky.algorithm.initialization.linearization_helper\
 from statistical_clear_sky.algorithm.initialization.weight_setting\
  import WeightSetting
 from statistical_clear_sky.algorithm.exception import ProblemStatusError
+from statistical_clear_sky.algorithm.kernels\
+ import weighted_quantile_cost, scaled_weighted_residuals
 from statistical_clear_sky.algorithm.minimization.left_matrix\
  import LeftMatrixMinimization
 from statistical_clear_sky.algorithm.minimization.right_matrix\
@@ -25,6 +27,8 @@ from statistical_clear_sky.algorithm.serialization.serialization_mixin\
 from statistical_clear_sky.algorithm.plot.plot_mixin import PlotMixin
 from statistical_clear_sky.utilities.data_loading import resample_index
 from statistical_clear_sky.utilities.progress import progress
+from statistical_clear_sky.utilities.difference_operators\
+ import second_difference_matrix
 
 class IterativeFitting(SerializationMixin, PlotMixin):
     """
@@ -32,14 +36,23 @@ class IterativeFitting(SerializationMixin, PlotMixin):
     """
 
     def __init__(self, data_matrix=None, data_handler_obj=None, rank_k=6,
-                 solver_type='MOSEK', reserve_test_data=False):
+                 solver_type='MOSEK', reserve_test_data=False,
+                 warm_start_svd=None):
         """
 
         :param data_matrix:
         :param data_handler_obj:
         :param rank_k:
-        :param solver_type:
+        :param solver_type: name of a CVXPY solver supporting second-order
+            cone constraints; besides the default 'MOSEK', 'CLARABEL' and
+            'SCS' fit both sub-year and multi-year data. QP solvers such as
+            OSQP cannot handle the smoothness terms. The subproblems are
+            re-solved with warm starts, which first-order solvers such as SCS
+            benefit from most
         :param reserve_test_data:
+        :param warm_start_svd: a previously constructed IterativeFitting on
+            similar data (e.g. an overlapping window), whose singular vectors
+            seed the initial decomposition
         """
         self._solver_type = solver_type
         self._rank_k = rank_k
@@ -55,12 +68,26 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         else:
             self._power_signals_d = data_matrix
 
+        if warm_start_svd is not None:
+            initial_left_singular_vectors_u =\
+                warm_start_svd.left_singular_vectors_u
+        else:
+            initial_left_singular_vectors_u = None
         self._decomposition = SingularValueDecomposition()
-        self._decomposition.decompose(data_matrix, rank_k=rank_k)
+        self._decomposition.decompose(data_matrix, rank_k=rank_k,
+            initial_left_singular_vectors_u=initial_left_singular_vectors_u)
 
         self._matrix_l0 = self._decomposition.matrix_l0
         self._matrix_r0 = self._decomposition.matrix_r0
         self._bootstrap_samples = None
+        # Product of the result matrices, see _obtain_clear_sky_signals:
+        self._clear_sky_signals = None
+
+        # Sparse operators for the smoothness terms of the objective:
+        self._time_second_difference = second_difference_matrix(
+            data_matrix.shape[0])
+        self._day_second_difference = second_difference_matrix(
+            data_matrix.shape[1])
 
         self._set_testdays(data_matrix, reserve_test_data)
         # Handle both DataHandler objects and reserving test data
@@ -112,14 +139,15 @@ class IterativeFitting(SerializationMixin, PlotMixin):
 
     @property
     def estimated_power_matrix(self):
-        left = self._l_cs_value
-        right = self._r_cs_value
-        mat = left.dot(right)
-        return mat
+        return self._obtain_clear_sky_signals().copy()
 
     @property
     def estimated_clear_sky(self):
-        return self._l_cs_value @ self._r_cs_value
+        return self._obtain_clear_sky_signals().copy()
+
+    @property
+    def left_singular_vectors_u(self):
+        return self._decomposition.left_singular_vectors_u
 
     @property
     def deg_rate(self):
@@ -198,7 +226,7 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         return self.beta_value
 
     def clear_sky_signals(self):
-        return self._l_cs_value.dot(self._r_cs_value)
+        return self._obtain_clear_sky_signals().copy()
 
     def _minimize_objective(self, l_cs_value, r_cs_value, beta_value,
                             component_r0, weights,
@@ -222,6 +250,7 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         objective_values = self._calculate_objective(mu_l, mu_r, tau,
             l_cs_value, r_cs_value, beta_value, weights,
             sum_components=False)
+        old_objective_value = np.sum(objective_values)
         if verbose:
             print('----------------------\nSCSF Problem Setup\n----------------------')
             msg1 = 'Matrix Size: {} x {} = {} power measurements'.format(
@@ -259,17 +288,19 @@ class IterativeFitting(SerializationMixin, PlotMixin):
             ps = 'Starting at Objective: {:.3e}, f1: {:.3e}, f2: {:.3e},'
             ps += ' f3: {:.3e}, f4: {:.3e}'
             print(ps.format(
-                np.sum(objective_values), objective_values[0],
+                old_objective_value, objective_values[0],
                 objective_values[1], objective_values[2],
                 objective_values[3]
             ))
         improvement = np.inf
-        old_objective_value = np.sum(objective_values)
         iteration = 0
         f1_last = objective_values[0]
 
         tol_schedule = [] #np.logspace(-4, -8, 6)
 
+        self._allocate_history_state_data(l_cs_value, r_cs_value,
+                                          max_iteration)
+
         while improvement >= exit_criterion_epsilon:
             try:
                 tol = tol_schedule[iteration]
@@ -277,7 +308,8 @@ class IterativeFitting(SerializationMixin, PlotMixin):
                 tol = 1e-8
 
             self._store_minimization_state_data(mu_l, mu_r, tau,
-                l_cs_value, r_cs_value, beta_value, component_r0)
+                l_cs_value, r_cs_value, beta_value, component_r0,
+                iteration=iteration)
 
             try:
                 if self.__left_first:
@@ -312,6 +344,9 @@ class IterativeFitting(SerializationMixin, PlotMixin):
                     r_cs_value = self._decomposition.matrix_r0
                     component_r0 = self._obtain_initial_component_r0(
                         verbose=verbose)
+                    # Discard the history of the abandoned run:
+                    self._allocate_history_state_data(l_cs_value, r_cs_value,
+                                                      max_iteration)
                     continue
                 else:
                     if verbose:
@@ -330,6 +365,9 @@ class IterativeFitting(SerializationMixin, PlotMixin):
                     r_cs_value = self._decomposition.matrix_r0
                     component_r0 = self._obtain_initial_component_r0(
                         verbose=verbose)
+                    # Discard the history of the abandoned run:
+                    self._allocate_history_state_data(l_cs_value, r_cs_value,
+                                                      max_iteration)
                     continue
                 else:
                     if verbose:
@@ -374,6 +412,9 @@ class IterativeFitting(SerializationMixin, PlotMixin):
                     l_cs_value = self._decomposition.matrix_l0
                     r_cs_value = self._decomposition.matrix_r0
                     component_r0 = self._obtain_initial_component_r0(verbose=verbose)
+                    # Discard the history of the abandoned run:
+                    self._allocate_history_state_data(l_cs_value, r_cs_value,
+                                                      max_iteration)
                 else:
                     if verbose:
                         print('Algorithm Failed!')
@@ -385,7 +426,8 @@ class IterativeFitting(SerializationMixin, PlotMixin):
 
 
             self._store_minimization_state_data(mu_l, mu_r, tau,
-                l_cs_value, r_cs_value, beta_value, component_r0)
+                l_cs_value, r_cs_value, beta_value, component_r0,
+                iteration=iteration)
 
         # except cvx.SolverError:
         #     if self.__left_first:
@@ -402,9 +444,10 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         if verbose:
             print('Minimization complete in {:.2f} minutes'.format(
                   (tf - ti) / 60.))
-        self._analyze_residuals(l_cs_value, r_cs_value, weights)
         self._keep_result_variables_as_properties(l_cs_value, r_cs_value,
                                                   beta_value)
+        self._analyze_residuals(l_cs_value, r_cs_value, weights,
+            clear_sky_signals=self._obtain_clear_sky_signals())
         if bootstraps is not None:
             if verbose:
                 print('Running bootstrap analysis...')
@@ -590,38 +633,20 @@ class IterativeFitting(SerializationMixin, PlotMixin):
 
     def _calculate_objective(self, mu_l, mu_r, tau, l_cs_value, r_cs_value,
                              beta_value, weights, sum_components=True):
-        weights_w1 = np.diag(weights)
-        # Note: Not using cvx.sum and cvx.abs as in following caused
-        # an error at * weights_w1:
-        # ValueError: operands could not be broadcast together with shapes
-        # (288,1300) (1300,1300)
-        # term_f1 = sum((0.5 * abs(
-        #     self._power_signals_d - l_cs_value.dot(r_cs_value))
-        #     + (tau - 0.5)
-        #     * (self._power_signals_d - l_cs_value.dot(r_cs_value)))
-        #     * weights_w1)
-        term_f1 = (cvx.sum((0.5 * cvx.abs(
-                    self._power_signals_d - l_cs_value.dot(r_cs_value))
-                    + (tau - 0.5) * (self._power_signals_d - l_cs_value.dot(
-                        r_cs_value))) @ weights_w1) ).value
-        weights_w2 = np.eye(self._rank_k)
-        term_f2 = mu_l * norm((l_cs_value[:-2, :] - 2 * l_cs_value[1:-1, :] +
-                               l_cs_value[2:, :]).dot(weights_w2), 'fro')
-        term_f3 = mu_r * norm(r_cs_value[:, :-2] - 2 * r_cs_value[:, 1:-1] +
-                               r_cs_value[:, 2:], 'fro')
+        term_f1 = weighted_quantile_cost(self._power_signals_d, l_cs_value,
+                                         r_cs_value, weights, tau)
+        term_f2 = mu_l * norm(self._time_second_difference @ l_cs_value,
+                              'fro')
+        term_f3 = mu_r * norm(r_cs_value @ self._day_second_difference.T,
+                              'fro')
         if r_cs_value.shape[1] < 365 + 2:
             term_f4 = 0
         else:
-            # Note: it was cvx.norm. Check if this modification makes a
-            # difference:
-            # term_f4 = (mu_r * norm(
-            #             r_cs_value[1:, :-365] - r_cs_value[1:, 365:], 'fro'))
-            term_f4 = ((mu_r * cvx.norm(
-                r_cs_value[1:, :-365] - r_cs_value[1:, 365:], 'fro'))).value
+            term_f4 = mu_r * norm(
+                r_cs_value[1:, :-365] - r_cs_value[1:, 365:], 'fro')
         components = [term_f1, term_f2, term_f3, term_f4]
-        objective = sum(components)
         if sum_components:
-            return objective
+            return sum(components)
         else:
             return components
 
@@ -702,16 +727,12 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         else:
             self._residual_l0_norm = None
 
-    def _analyze_residuals(self, l_cs_value, r_cs_value, weights):
+    def _analyze_residuals(self, l_cs_value, r_cs_value, weights,
+                           clear_sky_signals=None):
         # Residual analysis
-        weights_w1 = np.diag(weights)
-        wres = np.dot(l_cs_value.dot(
-                r_cs_value) - self._power_signals_d, weights_w1)
-        use_days = np.logical_not(np.isclose(np.sum(wres, axis=0), 0))
-        scaled_wres = wres[:, use_days] / np.average(
-                self._power_signals_d[:, use_days])
-        final_metric = scaled_wres[
-                self._power_signals_d[:, use_days] > 1e-3]
+        final_metric = scaled_weighted_residuals(self._power_signals_d,
+            l_cs_value, r_cs_value, weights,
+            clear_sky_signals=clear_sky_signals)
         self._residuals_median = np.median(final_metric)
         self._residuals_variance = np.power(np.std(final_metric), 2)
         self._residual_l0_norm = np.linalg.norm(
@@ -797,6 +818,18 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         self._l_cs_value = l_cs_value
         self._r_cs_value = r_cs_value
         self._beta_value = beta_value
+        # Invalidate the product of the previous result matrices:
+        self._clear_sky_signals = None
+
+    def _obtain_clear_sky_signals(self):
+        '''
+        Returns L @ R of the current result, computing it only once per
+        result since it is used by the residual analysis and several plots.
+        The public accessors return copies of it, which callers may modify.
+        '''
+        if self._clear_sky_signals is None:
+            self._clear_sky_signals = self._l_cs_value.dot(self._r_cs_value)
+        return self._clear_sky_signals
 
     def _keep_supporting_parameters_as_properties(self, weights):
         self._weights = weights
@@ -810,8 +843,20 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         self._state_data.mu_r = 1e3
         self._state_data.tau = 0.85
 
+    def _allocate_history_state_data(self, l_cs_value, r_cs_value,
+                                     max_iteration):
+        # Entry i holds the values after i iterations, entry 0 being the
+        # starting point. Only the first history_length entries are valid.
+        self._state_data.l_history = np.zeros(
+            (max_iteration + 1,) + l_cs_value.shape)
+        self._state_data.r_history = np.zeros(
+            (max_iteration + 1,) + r_cs_value.shape)
+        self._state_data.beta_history = np.zeros(max_iteration + 1)
+        self._state_data.history_length = 0
+
     def _store_minimization_state_data(self, mu_l, mu_r, tau,
-            l_cs_value, r_cs_value, beta_value, component_r0):
+            l_cs_value, r_cs_value, beta_value, component_r0,
+            iteration=None):
         self._state_data.mu_l = mu_l
         self._state_data.mu_r = mu_r
         self._state_data.tau = tau
@@ -819,6 +864,12 @@ class IterativeFitting(SerializationMixin, PlotMixin):
         self._state_data.r_value = r_cs_value
         self._state_data.beta_value = beta_value
         self._state_data.component_r0 = component_r0
+        if iteration is not None:
+            # Copied into the preallocated arrays rather than appended:
+            self._state_data.l_history[iteration] = l_cs_value
+            self._state_data.r_history[iteration] = r_cs_value
+            self._state_data.beta_history[iteration] = beta_value
+            self._state_data.history_length = iteration + 1
 
     def _store_final_state_data(self, weights):
         self._state_data.residuals_median = self._residuals_median
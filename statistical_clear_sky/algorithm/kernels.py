@@ -0,0 +1,172 @@
+"""
+This module defines fused numerical kernels for the parts of the algorithm
+that make full passes over the power signals matrix.
+If numba is installed, the kernels are JIT-compiled so that the matrix is
+streamed once without intermediate arrays. The compiled kernels are cached
+on disk, so only the first process using them pays the compilation cost.
+Otherwise, equivalent NumPy implementations are used.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+def weighted_quantile_cost(power_signals_d, l_cs_value, r_cs_value, weights,
+                           tau):
+    """
+    Calculates the first term of the objective function, the weighted
+    quantile regression cost between the power signals matrix and the
+    low-rank model `l_cs_value @ r_cs_value`.
+
+    Arguments
+    ---------
+    power_signals_d : numpy array
+        Power signals matrix, m x n.
+    l_cs_value : numpy array
+        Left low-rank matrix, m x k.
+    r_cs_value : numpy array
+        Right low-rank matrix, k x n.
+    weights : numpy array
+        Daily weights, length n.
+    tau : float
+        Quantile.
+
+    Returns
+    -------
+    float
+        The value of the cost function.
+    """
+    if NUMBA_AVAILABLE:
+        return _weighted_quantile_cost_numba(
+            np.ascontiguousarray(power_signals_d, dtype=np.float64),
+            np.ascontiguousarray(l_cs_value, dtype=np.float64),
+            np.ascontiguousarray(r_cs_value, dtype=np.float64),
+            np.ascontiguousarray(weights, dtype=np.float64), float(tau))
+    residual = power_signals_d - l_cs_value.dot(r_cs_value)
+    return np.sum((0.5 * np.abs(residual) + (tau - 0.5) * residual)
+                  * weights[np.newaxis, :])
+
+def scaled_weighted_residuals(power_signals_d, l_cs_value, r_cs_value,
+                              weights, threshold=1e-3,
+                              clear_sky_signals=None):
+    """
+    Calculates the residual metric used for residual analysis: weighted
+    residuals of the low-rank model, restricted to days with a non-zero
+    weighted residual, scaled by the average power over those days, and
+    kept only where the measured power is above `threshold`.
+
+    Arguments
+    ---------
+    power_signals_d : numpy array
+        Power signals matrix, m x n.
+    l_cs_value : numpy array
+        Left low-rank matrix, m x k.
+    r_cs_value : numpy array
+        Right low-rank matrix, k x n.
+    weights : numpy array
+        Daily weights, length n.
+
+    Keyword arguments
+    -----------------
+    threshold : float
+        Entries with measured power at or below this value are excluded.
+    clear_sky_signals : numpy array
+        The product `l_cs_value @ r_cs_value`, if already computed. Only
+        the NumPy implementation uses it; the numba kernels never form the
+        product.
+
+    Returns
+    -------
+    numpy array
+        One dimensional array of the selected, scaled residuals.
+    """
+    if NUMBA_AVAILABLE:
+        power_signals_d = np.ascontiguousarray(power_signals_d,
+                                               dtype=np.float64)
+        l_cs_value = np.ascontiguousarray(l_cs_value, dtype=np.float64)
+        r_cs_value = np.ascontiguousarray(r_cs_value, dtype=np.float64)
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+        wres_sums, power_sums, counts = _residual_column_sums_numba(
+            power_signals_d, l_cs_value, r_cs_value, weights, threshold)
+        use_days = np.logical_not(np.isclose(wres_sums, 0))
+        average_power = (np.sum(power_sums[use_days])
+                         / (power_signals_d.shape[0] * np.sum(use_days)))
+        offsets = np.concatenate(([0], np.cumsum(counts[use_days])))
+        return _collect_scaled_residuals_numba(power_signals_d, l_cs_value,
+            r_cs_value, weights, threshold, np.flatnonzero(use_days),
+            offsets, average_power)
+    if clear_sky_signals is None:
+        clear_sky_signals = l_cs_value.dot(r_cs_value)
+    wres = (clear_sky_signals - power_signals_d) * weights[np.newaxis, :]
+    use_days = np.logical_not(np.isclose(np.sum(wres, axis=0), 0))
+    scaled_wres = wres[:, use_days] / np.average(power_signals_d[:, use_days])
+    return scaled_wres[power_signals_d[:, use_days] > threshold]
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _weighted_quantile_cost_numba(power_signals_d, l_cs_value, r_cs_value,
+                                      weights, tau):
+        m, n = power_signals_d.shape
+        rank_k = l_cs_value.shape[1]
+        # Per-row partial sums keep the result independent of thread count.
+        row_costs = np.zeros(m)
+        for i in prange(m):
+            row_cost = 0.
+            for j in range(n):
+                residual = power_signals_d[i, j]
+                for p in range(rank_k):
+                    residual -= l_cs_value[i, p] * r_cs_value[p, j]
+                row_cost += ((0.5 * abs(residual) + (tau - 0.5) * residual)
+                             * weights[j])
+            row_costs[i] = row_cost
+        return row_costs.sum()
+
+    @njit(parallel=True, cache=True)
+    def _residual_column_sums_numba(power_signals_d, l_cs_value, r_cs_value,
+                                    weights, threshold):
+        m, n = power_signals_d.shape
+        rank_k = l_cs_value.shape[1]
+        wres_sums = np.zeros(n)
+        power_sums = np.zeros(n)
+        counts = np.zeros(n, dtype=np.int64)
+        for j in prange(n):
+            wres_sum = 0.
+            power_sum = 0.
+            count = 0
+            for i in range(m):
+                residual = -power_signals_d[i, j]
+                for p in range(rank_k):
+                    residual += l_cs_value[i, p] * r_cs_value[p, j]
+                wres_sum += residual * weights[j]
+                power_sum += power_signals_d[i, j]
+                if power_signals_d[i, j] > threshold:
+                    count += 1
+            wres_sums[j] = wres_sum
+            power_sums[j] = power_sum
+            counts[j] = count
+        return wres_sums, power_sums, counts
+
+    @njit(parallel=True, cache=True)
+    def _collect_scaled_residuals_numba(power_signals_d, l_cs_value,
+                                        r_cs_value, weights, threshold,
+                                        columns, offsets, average_power):
+        m = power_signals_d.shape[0]
+        rank_k = l_cs_value.shape[1]
+        scaled_residuals = np.empty(offsets[-1])
+        for c in prange(len(columns)):
+            j = columns[c]
+            position = offsets[c]
+            for i in range(m):
+                if power_signals_d[i, j] > threshold:
+                    residual = -power_signals_d[i, j]
+                    for p in range(rank_k):
+                        residual += l_cs_value[i, p] * r_cs_value[p, j]
+                    scaled_residuals[position] = (residual * weights[j]
+                                                  / average_power)
+                    position += 1
+        return scaled_residuals
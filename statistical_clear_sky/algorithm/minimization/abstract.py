@@ -35,7 +35,16 @@ class AbstractMinimization():
             self._construct_problem(l_cs_value, r_cs_value, beta_value, component_r0)
         else:
             self._update_parameters(l_cs_value, r_cs_value, beta_value, component_r0)
-        self._problem.solve(solver=self._solver_type)
+        # The cached problem is not DPP-compiled: the fixed matrix enters as a
+        # parameter multiplying a variable, and the parametric (DPP) form of
+        # that product is a tensor growing with m * n * k, which runs out of
+        # memory on multi-year data sets. Current parameter values are
+        # substituted as constants, so each solve is canonicalized anew.
+        # Successive iterations solve nearly identical problems. Solvers with
+        # warm start support (e.g. SCS) start from their previous solution,
+        # which CVXPY keeps with the cached problem.
+        self._problem.solve(solver=self._solver_type, warm_start=True,
+                            ignore_dpp=True)
         # self._problem.solve(solver='MOSEK', mosek_params={
         #     'MSK_DPAR_INTPNT_CO_TOL_PFEAS': tol,
         #     'MSK_DPAR_INTPNT_CO_TOL_DFEAS': tol,
@@ -76,12 +85,14 @@ class AbstractMinimization():
         Subclass defines which of l_cs and r_cs value is fixed.
         """
 
-        weights_w1 = cvx.diag(self._weights)
-        return cvx.sum((0.5 * cvx.abs(self._power_signals_d
-                        - l_cs_param @ r_cs_param)
-                      + (self._tau - 0.5) * (self._power_signals_d
-                        - l_cs_param @ r_cs_param))
-                     @ weights_w1)
+        # The residual expression is shared, so the low-rank product is
+        # canonicalized once.
+        residual = self._power_signals_d - l_cs_param @ r_cs_param
+        # Column-wise scaling by the daily weights, without materializing
+        # an n x n diagonal matrix.
+        return cvx.sum(cvx.multiply(0.5 * cvx.abs(residual)
+                                    + (self._tau - 0.5) * residual,
+                                    self._weights[np.newaxis, :]))
 
     @abstractmethod
     def _term_f2(self, l_cs_param, r_cs_param):
@@ -6,6 +6,8 @@ import numpy as np
 from statistical_clear_sky.algorithm.minimization.abstract\
  import AbstractMinimization
 from statistical_clear_sky.algorithm.exception import ProblemStatusError
+from statistical_clear_sky.utilities.difference_operators\
+ import second_difference_matrix
 
 class LeftMatrixMinimization(AbstractMinimization):
     """
@@ -19,6 +21,8 @@ class LeftMatrixMinimization(AbstractMinimization):
         super().__init__(power_signals_d, rank_k, weights, tau,
                          non_neg_constraints=non_neg_constraints, solver_type=solver_type)
         self._mu_l = mu_l
+        self._second_difference = second_difference_matrix(
+            power_signals_d.shape[0])
 
     def _define_variables_and_parameters(self, l_cs_value, r_cs_value, beta_value, component_r0):
         self.left_matrix = cvx.Variable(shape=(self._power_signals_d.shape[0],
@@ -39,9 +43,8 @@ class LeftMatrixMinimization(AbstractMinimization):
         self.r0.value = 1. / component_r0
 
     def _term_f2(self, l_cs_param, r_cs_param):
-        weights_w2 = np.eye(self._rank_k)
-        term_f2 = self._mu_l * cvx.norm((l_cs_param[:-2, :] - 2
-                * l_cs_param[1:-1, :] + l_cs_param[2:, :]) @ weights_w2, 'fro')
+        term_f2 = self._mu_l * cvx.norm(self._second_difference @ l_cs_param,
+                                        'fro')
         return term_f2
 
     def _term_f3(self, l_cs_param, r_cs_param):
@@ -5,6 +5,8 @@ import cvxpy as cvx
 from statistical_clear_sky.algorithm.minimization.abstract\
  import AbstractMinimization
 from statistical_clear_sky.algorithm.exception import ProblemStatusError
+from statistical_clear_sky.utilities.difference_operators\
+ import second_difference_matrix
 
 class RightMatrixModifiedMinimization(AbstractMinimization):
     """
@@ -20,6 +22,9 @@ class RightMatrixModifiedMinimization(AbstractMinimization):
         super().__init__(power_signals_d, rank_k, weights, tau,
                          non_neg_constraints=non_neg_constraints, solver_type=solver_type)
         self._mu_r = mu_r
+        # Operates on the padded right matrix, see _obtain_r_tilde.
+        self._second_difference = second_difference_matrix(
+            max(power_signals_d.shape[1], 365 + 2))
 
         self._is_degradation_calculated = is_degradation_calculated
         self._max_degradation = max_degradation
@@ -48,8 +53,8 @@ class RightMatrixModifiedMinimization(AbstractMinimization):
         Apply smoothness constraint to all rows of right matrix
         '''
         r_tilde = self._obtain_r_tilde(r_cs_param)
-        term_f2 = self._mu_r * cvx.norm(r_tilde[:, :-2] - 2
-                   * r_tilde[:, 1:-1] + r_tilde[:, 2:], 'fro')
+        term_f2 = self._mu_r * cvx.norm(r_tilde @ self._second_difference.T,
+                                        'fro')
         return term_f2
 
     def _term_f3(self, l_cs_param, r_cs_param, beta_param, component_r0):
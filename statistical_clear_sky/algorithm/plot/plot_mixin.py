@@ -91,8 +91,8 @@ class PlotMixin(object):
                 use_day = None
             plot_2d(self._power_signals_d, ax=ax[0], clear_days=use_day,
                     units=units)
-            plot_2d(self.clear_sky_signals(), ax=ax[1], clear_days=use_day,
-                    units=units)
+            plot_2d(self._obtain_clear_sky_signals(), ax=ax[1],
+                    clear_days=use_day, units=units)
             ax[0].set_xlabel('')
             ax[1].set_title('Estimated clear sky power')
             # ax[0].set_title('Measured power')
@@ -119,7 +119,7 @@ class PlotMixin(object):
         d1 = start_day
         d2 = d1 + num_days
         actual = self._power_signals_d[:, d1:d2].ravel(order='F')
-        clearsky = ((self.clear_sky_signals()))[:, d1:d2].ravel(order='F')
+        clearsky = ((self._obtain_clear_sky_signals()))[:, d1:d2].ravel(order='F')
         fig, ax = plt.subplots(nrows=1, figsize=figsize)
         ax.plot(actual, linewidth=1, label='measured power')
         ax.plot(clearsky, linewidth=1, color='red', label='clear sky signal')
@@ -139,7 +139,7 @@ class PlotMixin(object):
         d1 = start_day
         d2 = d1 + num_days
         actual = self._power_signals_d[:, d1:d2].ravel(order='F')
-        clearsky = ((self.clear_sky_signals()))[:, d1:d2].ravel(order='F')
+        clearsky = ((self._obtain_clear_sky_signals()))[:, d1:d2].ravel(order='F')
         fig, ax = plt.subplots(num=fig_title, nrows=2, figsize=figsize, sharex=True,
                                gridspec_kw={'height_ratios': [3, 1]})
         xs = np.linspace(d1, d2, len(actual))
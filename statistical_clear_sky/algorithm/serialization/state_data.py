@@ -19,6 +19,10 @@ class StateData(object):
         self._r_value = np.array([])
         self._beta_value = 0.0
         self._component_r0 = np.array([])
+        self._l_history = np.array([])
+        self._r_history = np.array([])
+        self._beta_history = np.array([])
+        self._history_length = 0
         self._mu_l = None
         self._mu_r = None
         self._tau = None
@@ -105,6 +109,38 @@ class StateData(object):
     def component_r0(self, value):
         self._component_r0 = value
 
+    @property
+    def l_history(self):
+        return self._l_history
+
+    @l_history.setter
+    def l_history(self, value):
+        self._l_history = value
+
+    @property
+    def r_history(self):
+        return self._r_history
+
+    @r_history.setter
+    def r_history(self, value):
+        self._r_history = value
+
+    @property
+    def beta_history(self):
+        return self._beta_history
+
+    @beta_history.setter
+    def beta_history(self, value):
+        self._beta_history = value
+
+    @property
+    def history_length(self):
+        return self._history_length
+
+    @history_length.setter
+    def history_length(self, value):
+        self._history_length = value
+
     @property
     def mu_l(self):
         return self._mu_l
@@ -16,7 +16,7 @@ def load_results():
     nrel_data = pd.read_csv(base + 'pvo_results.csv')
     slac_data = pd.read_csv(base + 'scsf-unified-results.csv')
     slac_data['all-pass'] = np.logical_and(
-        np.alltrue(np.logical_not(slac_data[['solver-error', 'f1-increase', 'obj-increase']]), axis=1),
+        np.all(np.logical_not(slac_data[['solver-error', 'f1-increase', 'obj-increase']]), axis=1),
         np.isfinite(slac_data['deg'])
     )
     cols = ['ID', 'rd', 'deg', 'rd_low', 'rd_high', 'all-pass',
@@ -0,0 +1,24 @@
+"""
+This module defines sparse finite difference operators used by the
+smoothness terms of the objective function.
+"""
+import scipy.sparse as sp
+
+def second_difference_matrix(length):
+    """
+    Builds the (length - 2) x length second-order difference operator, so
+    that `second_difference_matrix(m) @ x` equals
+    `x[:-2] - 2 * x[1:-1] + x[2:]` for an array `x` with `m` rows.
+
+    Arguments
+    ---------
+    length : integer
+        Length of the axis the operator is applied along.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The tridiagonal second difference operator.
+    """
+    return sp.diags([1., -2., 1.], [0, 1, 2], shape=(length - 2, length),
+                    format='csr')
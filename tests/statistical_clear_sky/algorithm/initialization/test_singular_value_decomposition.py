@@ -30,19 +30,21 @@ class TestSingularValueDecomposition(unittest.TestCase):
                                             [0.0, 1.0, 0.0, 0.0],
                                             [0.0, 0.0, 1.0, 0.0]])
 
-        expected_left_singular_vectors_u = np.array([[-0.46881027, -0.77474963,
-                                                     0.39354624, 0.1584339],
-                                                    [-0.49437073, -0.15174524,
-                                                     -0.6766346, -0.52415321],
-                                                    [0.51153077, 0.32155093,
-                                                     -0.27710787, 0.74709605],
-                                                    [0.5235941, 0.52282062,
-                                                     0.55722365, -0.37684163]])
+        # The first pair is flipped to a positive sum, the second and third
+        # to a positive largest-magnitude entry:
+        expected_left_singular_vectors_u = np.array([[-0.46881027, 0.77474963,
+                                                     -0.39354624, 0.1584339],
+                                                    [-0.49437073, 0.15174524,
+                                                     0.6766346, -0.52415321],
+                                                    [0.51153077, -0.32155093,
+                                                     0.27710787, 0.74709605],
+                                                    [0.5235941, -0.52282062,
+                                                     -0.55722365, -0.37684163]])
         expected_right_singular_vectors_v = np.array([[-0.24562222, 0.0,
                                                       0.0, -0.96936563],
-                                                     [0.96936563, 0.0,
-                                                      0.0, -0.24562222],
-                                                     [0.0, 1.0, 0.0, 0.0],
+                                                     [-0.96936563, 0.0,
+                                                      0.0, 0.24562222],
+                                                     [0.0, -1.0, 0.0, 0.0],
                                                      [0.0, 0.0, 1.0, 0.0]])
 
         decomposition = SingularValueDecomposition()
@@ -55,3 +57,63 @@ class TestSingularValueDecomposition(unittest.TestCase):
                                       expected_left_singular_vectors_u)
         np.testing.assert_array_equal(actual_right_singular_vectors_v,
                                       expected_right_singular_vectors_v)
+
+    def test_truncated_svd(self):
+
+        power_signals_d = np.random.RandomState(0).rand(20, 30)
+        rank_k = 4
+
+        (full_left_singular_vectors_u, full_singular_values_sigma,
+         full_right_singular_vectors_v) = np.linalg.svd(power_signals_d)
+        expected_low_rank_matrix = (full_left_singular_vectors_u[:, :rank_k]
+            * full_singular_values_sigma[:rank_k]).dot(
+            full_right_singular_vectors_v[:rank_k, :])
+
+        decomposition = SingularValueDecomposition()
+        decomposition.decompose(power_signals_d, rank_k=rank_k)
+
+        self.assertEqual(decomposition.matrix_l0.shape, (20, rank_k))
+        self.assertEqual(decomposition.matrix_r0.shape, (rank_k, 30))
+        np.testing.assert_almost_equal(
+            decomposition.singular_values_sigma,
+            full_singular_values_sigma[:rank_k])
+        np.testing.assert_almost_equal(
+            decomposition.matrix_l0.dot(decomposition.matrix_r0),
+            expected_low_rank_matrix)
+        # The signs of the singular vectors do not depend on the SVD routine:
+        expected_left_singular_vectors_u, expected_right_singular_vectors_v =\
+            decomposition._adjust_singular_vectors(
+                full_left_singular_vectors_u[:, :rank_k],
+                full_right_singular_vectors_v[:rank_k, :])
+        np.testing.assert_almost_equal(decomposition.matrix_l0,
+                                       expected_left_singular_vectors_u)
+        np.testing.assert_almost_equal(
+            decomposition.matrix_r0,
+            full_singular_values_sigma[:rank_k, np.newaxis]
+            * expected_right_singular_vectors_v)
+
+    def test_decompose_with_initial_left_singular_vectors(self):
+
+        random_state = np.random.RandomState(0)
+        low_rank_matrix = random_state.rand(20, 3).dot(random_state.rand(3, 30))
+        power_signals_d = low_rank_matrix + 1e-3 * random_state.rand(20, 30)
+        rank_k = 3
+
+        cold_decomposition = SingularValueDecomposition()
+        cold_decomposition.decompose(power_signals_d[:, :25], rank_k=rank_k)
+
+        expected_decomposition = SingularValueDecomposition()
+        expected_decomposition.decompose(power_signals_d[:, 5:], rank_k=rank_k)
+
+        warm_decomposition = SingularValueDecomposition()
+        warm_decomposition.decompose(power_signals_d[:, 5:], rank_k=rank_k,
+            initial_left_singular_vectors_u=\
+                cold_decomposition.left_singular_vectors_u)
+
+        np.testing.assert_almost_equal(
+            warm_decomposition.singular_values_sigma,
+            expected_decomposition.singular_values_sigma)
+        np.testing.assert_almost_equal(
+            warm_decomposition.matrix_l0.dot(warm_decomposition.matrix_r0),
+            expected_decomposition.matrix_l0.dot(
+                expected_decomposition.matrix_r0))
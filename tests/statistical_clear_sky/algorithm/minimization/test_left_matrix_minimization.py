@@ -65,6 +65,37 @@ class TestLeftMatrixMinimization(unittest.TestCase):
         np.testing.assert_array_equal(actual_r_cs_value, expected_r_cs_value)
         np.testing.assert_array_equal(actual_beta_value, expected_beta_value)
 
+    def test_cached_problem(self):
+        power_signals_d = np.array([[0.0, 0.0, 0.0, 0.0],
+                                    [1.33389997, 1.40310001, 0.67150003,
+                                     0.77249998],
+                                    [1.42349994, 1.51800001, 1.43809998,
+                                     1.20449996],
+                                    [1.52020001, 1.45150006, 1.84809995,
+                                     0.99949998]])
+        rank_k = 4
+        weights = np.array([0.0, 0.0, 0.97073243, 0.97243198])
+        l_cs_value = np.ones((4, rank_k))
+        r_cs_value = np.ones((rank_k, 4))
+        component_r0 = np.ones(4)
+
+        left_matrix_minimization = LeftMatrixMinimization(power_signals_d,
+            rank_k, weights, 0.9, 5e2, solver_type='ECOS')
+        left_matrix_minimization.minimize(l_cs_value, r_cs_value, 0.0,
+                                          component_r0)
+        problem = left_matrix_minimization._problem
+
+        # New parameter values and weights reuse the cached problem:
+        left_matrix_minimization.minimize(l_cs_value, 2 * r_cs_value, 0.0,
+                                          component_r0)
+        self.assertIs(left_matrix_minimization._problem, problem)
+        left_matrix_minimization.update_weights(np.ones(4))
+        left_matrix_minimization.minimize(l_cs_value, r_cs_value, 0.0,
+                                          component_r0)
+        self.assertIs(left_matrix_minimization._problem, problem)
+        np.testing.assert_array_equal(
+            left_matrix_minimization._weights.value, np.ones(4))
+
     def test_minimize_with_large_data(self):
 
         input_power_signals_file_path = os.path.abspath(
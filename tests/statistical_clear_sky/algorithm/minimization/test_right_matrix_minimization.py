@@ -7,6 +7,53 @@ from statistical_clear_sky.algorithm.minimization.right_matrix\
 
 class TestRightMatrixMinimization(unittest.TestCase):
 
+    def test_minimize_with_less_than_a_year(self):
+
+        input_power_signals_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+            "../../fixtures/right_matrix_minimization",
+            "three_years_power_signals_d_1.csv"))
+        with open(input_power_signals_file_path) as file:
+            # Every 12th time step keeps the problem small:
+            power_signals_d = np.loadtxt(file, delimiter=',')[::12, :60]
+
+        rank_k = 6
+        weights = np.ones(power_signals_d.shape[1])
+        tau = 0.9
+        mu_r = 1e3
+        component_r0 = np.ones(power_signals_d.shape[1])
+
+        l_cs_value_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+            "../../fixtures/right_matrix_minimization",
+            "l_cs_value_after_left_matrix_minimization_iteration_1.csv"))
+        with open(l_cs_value_file_path) as file:
+            l_cs_value = np.loadtxt(file, delimiter=',')[::12]
+
+        r_cs_value_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+            "../../fixtures/right_matrix_minimization",
+            "r_cs_value_after_left_matrix_minimization_iteration_1.csv"))
+        with open(r_cs_value_file_path) as file:
+            r_cs_value = np.loadtxt(file, delimiter=',')[:, :60]
+
+        right_matrix_minimization = RightMatrixMinimization(power_signals_d,
+            rank_k, weights, tau, mu_r, solver_type='CLARABEL')
+
+        _, actual_r_cs_value, _ = right_matrix_minimization.minimize(
+            l_cs_value, r_cs_value, 0.0, component_r0)
+
+        # The padding days are free, so the minimized objective is the
+        # quantile cost plus the smoothness term of the actual days only:
+        problem = right_matrix_minimization._problem
+        residual = power_signals_d - l_cs_value.dot(actual_r_cs_value)
+        expected_value = (np.sum(0.5 * np.abs(residual)
+                                 + (tau - 0.5) * residual)
+                          + mu_r * np.linalg.norm(
+                              np.diff(actual_r_cs_value, n=2, axis=1),
+                              'fro'))
+        np.testing.assert_allclose(problem.value, expected_value, rtol=1e-6)
+
     def test_minimize_with_large_data(self):
 
         input_power_signals_file_path = os.path.abspath(
@@ -0,0 +1,37 @@
+import unittest
+import os
+import numpy as np
+from statistical_clear_sky.algorithm.batch_fitting import batch_fit
+
+class TestBatchFitting(unittest.TestCase):
+
+    def test_batch_fit(self):
+
+        input_power_signals_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+            "../fixtures/for_mock/three_years_power_signals_d_1.csv"))
+        with open(input_power_signals_file_path) as file:
+            power_signals_d = np.loadtxt(file, delimiter=',')
+
+        # Small data sets, so that ECOS can solve them:
+        data_matrices = [power_signals_d[::12, :60],
+                         power_signals_d[::12, 400:460]]
+
+        fits = batch_fit(data_matrices, max_workers=2,
+                         fitting_kwargs=dict(rank_k=3, solver_type='ECOS',
+                                             reserve_test_data=0.2),
+                         execute_kwargs=dict(max_iteration=2))
+
+        self.assertEqual(len(fits), 2)
+        for data_matrix, iterative_fitting in zip(data_matrices, fits):
+            # Results come back in the order of the input:
+            np.testing.assert_array_equal(
+                iterative_fitting.measured_power_matrix, data_matrix)
+            self.assertEqual(iterative_fitting.clear_sky_signals().shape,
+                             data_matrix.shape)
+            # Constructor arguments reach each fit:
+            self.assertEqual(iterative_fitting.left_low_rank_matrix().shape,
+                             (data_matrix.shape[0], 3))
+            self.assertEqual(len(iterative_fitting.test_days), 12)
+            self.assertIsNone(iterative_fitting.left_problem)
+            self.assertIsNone(iterative_fitting.right_problem)
@@ -1,5 +1,6 @@
 import unittest
 import os
+import warnings
 import numpy as np
 import cvxpy as cvx
 from statistical_clear_sky.algorithm.iterative_fitting import IterativeFitting
@@ -58,3 +59,53 @@ class TestIterativeFitting(unittest.TestCase):
         np.testing.assert_almost_equal(actual_objective_values,
                                        expected_objective_values,
                                        decimal=8)
+
+    def test_warm_start_svd(self):
+
+        input_power_signals_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+                "../fixtures/objective_calculation",
+                "three_years_power_signals_d_1.csv"))
+        with open(input_power_signals_file_path) as file:
+            power_signals_d = np.loadtxt(file, delimiter=',')
+
+        rank_k = 6
+
+        # A year of data, and the same year shifted by a month:
+        previous_fitting = IterativeFitting(power_signals_d[:, :365],
+                                            rank_k=rank_k)
+        warm_fitting = IterativeFitting(power_signals_d[:, 30:395],
+                                        rank_k=rank_k,
+                                        warm_start_svd=previous_fitting)
+        cold_fitting = IterativeFitting(power_signals_d[:, 30:395],
+                                        rank_k=rank_k)
+
+        warm_matrix_l0 = warm_fitting.state_data.matrix_l0
+        warm_matrix_r0 = warm_fitting.state_data.matrix_r0
+        cold_matrix_l0 = cold_fitting.state_data.matrix_l0
+        cold_matrix_r0 = cold_fitting.state_data.matrix_r0
+
+        np.testing.assert_allclose(warm_matrix_l0, cold_matrix_l0, atol=5e-3)
+        np.testing.assert_allclose(warm_matrix_r0, cold_matrix_r0,
+                                   atol=5e-3 * np.max(np.abs(cold_matrix_r0)))
+
+    def test_execute_with_less_than_a_year(self):
+
+        input_power_signals_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+                "../fixtures/for_mock",
+                "three_years_power_signals_d_1.csv"))
+        with open(input_power_signals_file_path) as file:
+            power_signals_d = np.loadtxt(file, delimiter=',')[::6, 500:560]
+
+        iterative_fitting = IterativeFitting(power_signals_d, rank_k=4,
+                                             solver_type='CLARABEL')
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            iterative_fitting.execute(max_iteration=4, verbose=False)
+
+        # Every subproblem on the padded right matrix is solved accurately,
+        # so the fit neither restarts nor fails:
+        self.assertEqual([str(warning.message) for warning in caught_warnings
+                          if 'inaccurate' in str(warning.message)], [])
+        self.assertFalse(iterative_fitting.state_data.is_problem_status_error)
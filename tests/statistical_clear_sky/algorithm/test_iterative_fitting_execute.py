@@ -4,6 +4,7 @@ import os
 import numpy as np
 import cvxpy as cvx
 from statistical_clear_sky.algorithm.iterative_fitting import IterativeFitting
+from statistical_clear_sky.algorithm.exception import ProblemStatusError
 from statistical_clear_sky.algorithm.initialization.linearization_helper\
  import LinearizationHelper
 from statistical_clear_sky.algorithm.initialization.weight_setting\
@@ -151,8 +152,75 @@ class TestIterativeFittingExecute(unittest.TestCase):
         np.testing.assert_almost_equal(actual_clear_sky_signals,
                                        expected_clear_sky_signals,
                                        decimal=13)
+        # Modifying a returned result in place does not affect later calls:
+        actual_clear_sky_signals[:] = 0
+        np.testing.assert_almost_equal(iterative_fitting.clear_sky_signals(),
+                                       expected_clear_sky_signals,
+                                       decimal=13)
         # np.testing.assert_array_equal(actual_degradation_rate,
         #                               expected_degradation_rate)
         np.testing.assert_almost_equal(actual_degradation_rate,
                                        expected_degradation_rate,
                                        decimal=8)
+
+        # Per-iteration history, entry i holding the values after
+        # i iterations:
+        state_data = iterative_fitting.state_data
+        self.assertEqual(state_data.l_history.shape, (16, 288, rank_k))
+        iterations = self.mock_left_matrix_minimization.minimize.call_count
+        self.assertEqual(state_data.history_length, iterations + 1)
+        np.testing.assert_array_equal(state_data.l_history[iterations],
+                                      iterative_fitting.left_low_rank_matrix())
+        np.testing.assert_array_equal(state_data.r_history[iterations],
+                                      iterative_fitting.right_low_rank_matrix())
+
+    def test_execute_history_after_restart(self):
+
+        input_power_signals_file_path = os.path.abspath(
+            os.path.join(os.path.dirname(__file__),
+            "../fixtures/for_mock/three_years_power_signals_d_1.csv"))
+        with open(input_power_signals_file_path) as file:
+            power_signals_d = np.loadtxt(file, delimiter=',')
+
+        # The fourth left matrix minimization fails, so the algorithm starts
+        # over in reverse order after three iterations. The run after the
+        # restart stops when the right matrix minimization fails in its
+        # second iteration.
+        left_matrix_minimize_return_values = list(
+            self.mock_left_matrix_minimization.minimize.side_effect)
+        left_matrix_minimize_return_values.insert(
+            3, ProblemStatusError('Minimize L status: infeasible'))
+        self.mock_left_matrix_minimization.minimize.side_effect =\
+            left_matrix_minimize_return_values
+        right_matrix_minimize_return_values = list(
+            self.mock_right_matrix_minimization.minimize.side_effect)
+        right_matrix_minimize_return_values.insert(
+            4, ProblemStatusError('Minimize R status: infeasible'))
+        self.mock_right_matrix_minimization.minimize.side_effect =\
+            right_matrix_minimize_return_values
+
+        iterative_fitting = IterativeFitting(power_signals_d, rank_k=6)
+
+        # Inject mock objects by dependency injection:
+        iterative_fitting.set_linearization_helper(
+            self.mock_linearization_helper)
+        iterative_fitting.set_weight_setting(self.mock_weight_setting)
+        iterative_fitting.set_left_matrix_minimization(
+            self.mock_left_matrix_minimization)
+        iterative_fitting.set_right_matrix_minimization(
+            self.mock_right_matrix_minimization)
+
+        iterative_fitting.execute(mu_l=5e2, mu_r=1e3, tau=0.9,
+                                  max_iteration=15, verbose=False)
+
+        # Only the one iteration after the restart is recorded, and nothing
+        # is left over from the abandoned run:
+        state_data = iterative_fitting.state_data
+        self.assertTrue(state_data.is_problem_status_error)
+        self.assertEqual(state_data.history_length, 2)
+        np.testing.assert_array_equal(state_data.l_history[0],
+                                      iterative_fitting._matrix_l0)
+        np.testing.assert_array_equal(state_data.l_history[1],
+                                      iterative_fitting.left_low_rank_matrix())
+        np.testing.assert_array_equal(state_data.l_history[2:], 0)
+        np.testing.assert_array_equal(state_data.r_history[2:], 0)
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+from statistical_clear_sky.algorithm import kernels
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self.power_signals_d = random_state.rand(30, 40)
+        self.l_cs_value = random_state.rand(30, 3)
+        self.r_cs_value = random_state.rand(3, 40)
+        self.weights = random_state.rand(40)
+        self.tau = 0.9
+
+    def _implementations(self):
+        """
+        Values of NUMBA_AVAILABLE selecting each implementation that can run
+        here, so that the NumPy fallback is tested even with numba installed.
+        """
+        if kernels.NUMBA_AVAILABLE:
+            return [False, True]
+        return [False]
+
+    def test_weighted_quantile_cost(self):
+        residual = (self.power_signals_d
+                    - self.l_cs_value.dot(self.r_cs_value))
+        expected_cost = np.sum((0.5 * np.abs(residual)
+                                + (self.tau - 0.5) * residual)
+                               .dot(np.diag(self.weights)))
+
+        for numba_available in self._implementations():
+            with self.subTest(numba_available=numba_available),\
+                 patch.object(kernels, 'NUMBA_AVAILABLE', numba_available):
+                actual_cost = kernels.weighted_quantile_cost(
+                    self.power_signals_d, self.l_cs_value, self.r_cs_value,
+                    self.weights, self.tau)
+
+                np.testing.assert_almost_equal(actual_cost, expected_cost,
+                                               decimal=10)
+
+    def test_scaled_weighted_residuals(self):
+        self.power_signals_d[self.power_signals_d < 0.2] = 0
+        self.weights[::4] = 0
+        wres = np.dot(self.l_cs_value.dot(self.r_cs_value)
+                      - self.power_signals_d, np.diag(self.weights))
+        use_days = np.logical_not(np.isclose(np.sum(wres, axis=0), 0))
+        scaled_wres = wres[:, use_days] / np.average(
+            self.power_signals_d[:, use_days])
+        expected_metric = scaled_wres[
+            self.power_signals_d[:, use_days] > 1e-3]
+
+        for numba_available in self._implementations():
+            with self.subTest(numba_available=numba_available),\
+                 patch.object(kernels, 'NUMBA_AVAILABLE', numba_available):
+                actual_metric = kernels.scaled_weighted_residuals(
+                    self.power_signals_d, self.l_cs_value, self.r_cs_value,
+                    self.weights)
+
+                # Selected entries may come back in a different order.
+                np.testing.assert_almost_equal(np.sort(actual_metric),
+                                               np.sort(expected_metric),
+                                               decimal=12)
+
+    @patch.object(kernels, 'NUMBA_AVAILABLE', False)
+    def test_scaled_weighted_residuals_with_clear_sky_signals(self):
+        # Only the NumPy implementation uses the precomputed product.
+        expected_metric = kernels.scaled_weighted_residuals(
+            self.power_signals_d, self.l_cs_value, self.r_cs_value,
+            self.weights)
+
+        # Inconsistent factors show that the given product is used:
+        actual_metric = kernels.scaled_weighted_residuals(
+            self.power_signals_d, np.zeros_like(self.l_cs_value),
+            self.r_cs_value, self.weights,
+            clear_sky_signals=self.l_cs_value.dot(self.r_cs_value))
+
+        np.testing.assert_almost_equal(np.sort(actual_metric),
+                                       np.sort(expected_metric), decimal=12)